@@ -1,36 +1,107 @@
+import os
+
 import streamlit as st
 
+from task_store import ORDERS, STATUS_FILTERS, TaskStore
+
+# Database file shared by every session
+TASKS_DB = os.environ.get("TODO_DB", "tasks.db")
+PAGE_SIZE = 20
+
+# One store per server process, shared across sessions
+@st.cache_resource
+def get_store(db_path):
+    return TaskStore(db_path)
+
+# Button callbacks run before the script, so the page renders the updated list
+def add_task(store):
+    new_task = st.session_state.new_task.strip()
+    if new_task:
+        due = st.session_state.new_due
+        store.add(new_task, due.isoformat() if due else None)
+        st.session_state.new_task = ""
+        st.session_state.message = ("success", f"Task '{new_task}' added!")
+    else:
+        st.session_state.message = ("warning", "Please enter a task.")
+
+def toggle_task(store, task_id):
+    store.set_done(task_id, st.session_state[f"done_{task_id}"])
+
+def delete_task(store, task):
+    store.delete(task["id"])
+    st.session_state.message = ("success", f"Task '{task['text']}' deleted!")
+
+# Bulk import/export in the sidebar
+def import_export(store):
+    st.sidebar.header("Import / Export")
+    uploaded_file = st.sidebar.file_uploader("Import tasks", type=["json", "csv"])
+    if uploaded_file is not None and st.sidebar.button("Import"):
+        file_format = uploaded_file.name.rsplit(".", 1)[-1].lower()
+        try:
+            added = store.import_file(uploaded_file.getvalue().decode("utf-8-sig"), file_format)
+            st.sidebar.success(f"Imported {added} task(s).")
+        except ValueError as import_error:
+            st.sidebar.error(f"Error importing file: {import_error}")
+
+    file_format = st.sidebar.selectbox("Export format", ["json", "csv"])
+    if st.sidebar.button("Prepare export"):
+        st.sidebar.download_button(
+            "Download tasks",
+            store.export_file(file_format),
+            file_name=f"tasks.{file_format}"
+        )
+
 # To-Do List function
 def todo_list():
     st.title("To-Do List")
     st.write("Manage your daily tasks here.")
 
-    # Create a list to store tasks (for demo, we will use session_state to persist tasks)
-    if "tasks" not in st.session_state:
-        st.session_state.tasks = []
+    store = get_store(TASKS_DB)
+    import_export(store)
 
     # Add new task input
-    new_task = st.text_input("Add a new task")
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.text_input("Add a new task", key="new_task")
+    with col2:
+        st.date_input("Due date", value=None, key="new_due")
+    st.button("Add Task", on_click=add_task, args=(store,))
+
+    if "message" in st.session_state:
+        level, text = st.session_state.pop("message")
+        getattr(st, level)(text)
+
+    # Filters
+    col3, col4 = st.columns(2)
+    with col3:
+        status = st.selectbox("Show", list(STATUS_FILTERS), key="status")
+    with col4:
+        order = st.selectbox("Sort by", list(ORDERS), key="order")
 
-    if st.button("Add Task"):
-        if new_task:
-            st.session_state.tasks.append(new_task)
-            st.success(f"Task '{new_task}' added!")
+    total = store.count(status)
+    if not total:
+        if status == "all":
+            st.write("No tasks added yet. Start by adding a task!")
         else:
-            st.warning("Please enter a task.")
-
-    # Display tasks
-    if st.session_state.tasks:
-        st.write("### Your Tasks:")
-        for index, task in enumerate(st.session_state.tasks):
-            task_container = st.container()
-            task_container.write(f"- {task}")
-            if st.button(f"Delete {task}", key=task):
-                st.session_state.tasks.remove(task)
-                task_container.empty()
-                st.success(f"Task '{task}' deleted!")
-    else:
-        st.write("No tasks added yet. Start by adding a task!")
+            st.write("No tasks match this filter.")
+        return
+
+    # Only the current page is queried and rendered
+    pages = (total + PAGE_SIZE - 1) // PAGE_SIZE
+    if st.session_state.get("page", 1) > pages:
+        st.session_state.page = pages
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, key="page") - 1
+
+    st.write(f"### Your Tasks ({total}):")
+    for task in store.page(page, PAGE_SIZE, status, order):
+        task_id = task["id"]
+        col5, col6 = st.columns([5, 1])
+        with col5:
+            label = task["text"] + (f" (due {task['due_date']})" if task["due_date"] else "")
+            st.checkbox(label, value=bool(task["done"]), key=f"done_{task_id}",
+                        on_change=toggle_task, args=(store, task_id))
+        with col6:
+            st.button("Delete", key=f"delete_{task_id}", on_click=delete_task, args=(store, task))
 
 if __name__ == "__main__":
     todo_list()
@@ -1,11 +1,12 @@
 import streamlit as st
 import pandas as pd
-import os
+import io
 import numpy as np
 
-# Ensure uploads folder exists
-UPLOAD_FOLDER = "uploads"
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+# Parse each uploaded workbook once; reruns and other sessions reuse the DataFrame
+@st.cache_data(show_spinner=False)
+def load_excel(file_bytes):
+    return pd.read_excel(io.BytesIO(file_bytes))
 
 def main():
     # App Title
@@ -18,13 +19,8 @@ def main():
 
     if uploaded_file is not None:
         try:
-            # Save uploaded file temporarily
-            file_path = os.path.join(UPLOAD_FOLDER, uploaded_file.name)
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
             # Load Excel data into a DataFrame
-            df = pd.read_excel(file_path)
+            df = load_excel(uploaded_file.getvalue())
             
             # Sidebar for additional options
             st.sidebar.header("📋 Data Insights")
@@ -0,0 +1,254 @@
+import argparse
+import dataclasses
+import statistics
+import threading
+import time
+from unittest.mock import patch
+
+# st.fragment(run_every=...) used by crash_game.py
+MIN_STREAMLIT = "1.37"
+
+# Concurrency benchmark for the crash game, both models on a real clock:
+#   blocking   - old Start handler: one thread per round sleeping between ticks
+#                (only the sleeps; the per-tick placeholder updates are not counted)
+#   time-based - crash_game.py driven through AppTest; every live session gets
+#                the flight_display fragment rerun that st.fragment(run_every=...)
+#                requests each tick
+# Per-tick latency is how late each session's tick is rendered after it was due.
+# AppTest drives sessions one at a time and polls with short sleeps, so its wall
+# time overstates the server's; process CPU time per rerun is the real cost, and
+# tick / cpu ms is roughly how many live sessions one core sustains. The harness
+# line is the same cost for an empty script, i.e. AppTest's own overhead.
+
+
+class ThreadSampler:
+    """
+    Records the peak thread count while active
+    """
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, threading.active_count())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        # The sampler itself is not part of the workload
+        self.peak -= 1
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    return {
+        'ticks': len(latencies),
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+        'max_ms': latencies[-1] * 1000
+    }
+
+
+def blocking_rounds(n_sessions, tick, duration):
+    """
+    Old model: every running round holds a thread that sleeps between ticks
+    :param n_sessions: Number of concurrent sessions
+    :param tick: Seconds between ticks
+    :param duration: Seconds each flight lasts
+    :return: Tick latency summary and peak thread count
+    """
+    latencies = []
+    lock = threading.Lock()
+
+    def flight():
+        start = time.perf_counter()
+        local = []
+        for step in range(1, int(duration / tick) + 1):
+            time.sleep(tick)
+            local.append(time.perf_counter() - (start + step * tick))
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=flight) for _ in range(n_sessions)]
+    with ThreadSampler() as sampler:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return {**summarize(latencies), 'peak_threads': sampler.peak}
+
+
+def start_session(app):
+    app.run()
+    app.button[0].click().run()  # Start
+    return app
+
+
+def check_streamlit():
+    """
+    Fail early, with a readable message, if this Streamlit can't run the benchmark.
+    fragment_rerun relies on private AppTest/ScriptRunner internals (checked
+    against Streamlit 1.66) that a release may rename.
+    """
+    import streamlit
+    from packaging.version import Version
+
+    if Version(streamlit.__version__) < Version(MIN_STREAMLIT):
+        raise RuntimeError(f"Streamlit >= {MIN_STREAMLIT} required, found {streamlit.__version__}")
+
+    from streamlit.runtime.fragment import MemoryFragmentStorage
+    from streamlit.runtime.scriptrunner_utils.script_requests import RerunData
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    fields = {field.name for field in dataclasses.fields(RerunData)}
+    missing = [
+        name for name, present in (
+            ("RerunData.fragment_id_queue", "fragment_id_queue" in fields),
+            ("RerunData.is_auto_rerun", "is_auto_rerun" in fields),
+            ("LocalScriptRunner.request_rerun", hasattr(LocalScriptRunner, "request_rerun")),
+            ("MemoryFragmentStorage._fragments", "_fragments" in vars(MemoryFragmentStorage())),
+        )
+        if not present
+    ]
+    if missing:
+        raise RuntimeError(
+            f"Streamlit {streamlit.__version__} lacks internals used to rerun fragments "
+            f"({', '.join(missing)}); run the benchmark with Streamlit 1.66"
+        )
+
+
+def fragment_rerun(app):
+    """
+    Rerun only the page's fragment, as the browser's auto-rerun request does.
+    AppTest has no public API for this, so the rerun request is rewritten.
+    """
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    storage = getattr(app, "_fragment_storage", None)
+    if storage is None or not hasattr(storage, "_fragments"):
+        raise RuntimeError("AppTest no longer exposes its fragment storage; see check_streamlit()")
+    fragment_ids = list(storage._fragments)
+    request_rerun = LocalScriptRunner.request_rerun
+
+    def auto_rerun(runner, rerun_data):
+        return request_rerun(runner, dataclasses.replace(
+            rerun_data, fragment_id_queue=fragment_ids, is_auto_rerun=True
+        ))
+
+    with patch.object(LocalScriptRunner, "request_rerun", auto_rerun):
+        app.run()
+
+
+def harness_cost(repeat=20):
+    """
+    Mean wall and CPU time of an AppTest run of an empty script, in ms
+    """
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_string("import streamlit as st")
+    app.run()
+    start, cpu_start = time.perf_counter(), time.process_time()
+    for _ in range(repeat):
+        app.run()
+    return (
+        (time.perf_counter() - start) / repeat * 1000,
+        (time.process_time() - cpu_start) / repeat * 1000
+    )
+
+
+def time_based_rounds(n_sessions, tick, duration):
+    """
+    New model: sessions hold no thread between ticks; each tick reruns the
+    flight_display fragment of that session.
+    :param n_sessions: Number of concurrent sessions
+    :param tick: Seconds between ticks
+    :param duration: Seconds to drive the sessions
+    :return: Tick latency summary, peak thread count and mean rerun wall/CPU time
+    """
+    # Imported lazily so the blocking benchmark runs without Streamlit
+    from streamlit.testing.v1 import AppTest
+
+    apps = [start_session(AppTest.from_file("crash_game.py", default_timeout=30)) for _ in range(n_sessions)]
+    # Stagger session clocks like independent users
+    next_due = [time.perf_counter() + tick * i / n_sessions for i in range(n_sessions)]
+    end = time.perf_counter() + duration
+
+    latencies = []
+    rerun_costs = []
+    rerun_cpu = []
+    restarts = 0
+    with ThreadSampler() as sampler:
+        while True:
+            i = min(range(n_sessions), key=next_due.__getitem__)
+            due = next_due[i]
+            if due > end:
+                break
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            app = apps[i]
+            rerun_start, cpu_start = time.perf_counter(), time.process_time()
+            fragment_rerun(app)
+            done = time.perf_counter()
+            rerun_cpu.append(time.process_time() - cpu_start)
+            rerun_costs.append(done - rerun_start)
+            latencies.append(done - due)
+            next_due[i] = due + tick
+
+            # Crashed rounds go straight into a new one (Play Again, then Start)
+            if not app.session_state["round"].running():
+                app.run()
+                app.button[0].click().run()
+                app.button[0].click().run()
+                restarts += 1
+
+    return {
+        **summarize(latencies),
+        'peak_threads': sampler.peak,
+        'rerun_ms': statistics.mean(rerun_costs) * 1000,
+        'rerun_cpu_ms': statistics.mean(rerun_cpu) * 1000,
+        'restarts': restarts
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crash game concurrency benchmark")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--tick", type=float, default=0.2, help="Seconds between ticks (game refresh interval)")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds to run each scenario")
+    args = parser.parse_args()
+
+    try:
+        check_streamlit()
+    except (ImportError, RuntimeError) as error:
+        parser.exit(1, f"bench_crash_rounds: {error}\n")
+
+    harness_wall, harness_cpu = harness_cost()
+    print(f"harness: {harness_wall:.1f} ms wall, {harness_cpu:.1f} ms CPU per AppTest run of an empty script\n")
+    print(f"{'model':<10} {'sessions':>8} {'ticks':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} "
+          f"{'threads':>8} {'rerun ms':>9} {'cpu ms':>7} {'per core':>9}")
+    for n in args.sessions:
+        for model, func in (("blocking", blocking_rounds), ("time-based", time_based_rounds)):
+            result = func(n, args.tick, args.duration)
+            if 'rerun_ms' in result:
+                rerun = (f"{result['rerun_ms']:>9.1f} {result['rerun_cpu_ms']:>7.1f} "
+                         f"{args.tick * 1000 / result['rerun_cpu_ms']:>9.0f}")
+            else:
+                rerun = f"{'-':>9} {'-':>7} {'-':>9}"
+            print(
+                f"{model:<10} {n:>8} {result['ticks']:>6} {result['p50_ms']:>8.1f} "
+                f"{result['p95_ms']:>8.1f} {result['max_ms']:>8.1f} {result['peak_threads']:>8} {rerun}"
+            )
+
+
+if __name__ == "__main__":
+    main()
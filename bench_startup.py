@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+# Startup benchmark: import time per module, time-to-first-render and peak
+# memory of each app run on its own vs. all of them hosted by streamlit_app.py
+
+APP_SCRIPTS = ["app.py", "calculator.py", "crash_game.py", "TO-DO-LIST.py"]
+MODULES = ["streamlit", "app", "calculator", "crash_sim", "crash_game",
+           "task_store", "TO-DO-LIST", "health", "streamlit_app"]
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\S+)$")
+
+
+def import_time(module_name):
+    """
+    Cumulative import time of a module in a fresh interpreter
+    :return: Milliseconds, or None if the import fails
+    """
+    # __import__ rather than importlib.import_module, which -X importtime doesn't report
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"__import__({module_name!r})"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match and match.group(3) == module_name:
+            return int(match.group(2)) / 1000
+    return None
+
+
+def run_child(script, pages):
+    """
+    Render a script with AppTest in a fresh process
+    :param script: Main script to run
+    :param pages: url paths to visit after the first render (launcher only)
+    :return: Dictionary with timings in ms and peak RSS in MB
+    """
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", script] + pages,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def child(script, pages):
+    start = time.perf_counter()
+    import resource
+    from streamlit.testing.v1 import AppTest
+    from streamlit.testing.v1.app_test import calc_hash
+
+    app = AppTest.from_file(script, default_timeout=60)
+    app.run()
+    first_render = (time.perf_counter() - start) * 1000
+
+    page_renders = {}
+    for page in pages:
+        page_start = time.perf_counter()
+        # AppTest.switch_page only resolves file-based pages; st.Page hashes its url path
+        app._page_hash = calc_hash(page)
+        app.run()
+        page_renders[page] = (time.perf_counter() - page_start) * 1000
+
+    print(json.dumps({
+        'first_render_ms': first_render,
+        'page_render_ms': page_renders,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time and memory benchmark")
+    parser.add_argument("--child", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], args.child[1:])
+        return
+
+    # Keep the To-Do page away from the real task database
+    os.environ["TODO_DB"] = os.path.join(tempfile.mkdtemp(), "tasks.db")
+
+    print("Import time (fresh interpreter, cumulative)")
+    for module_name in MODULES:
+        elapsed = import_time(module_name)
+        print(f"  {module_name:<16} " + (f"{elapsed:8.1f} ms" if elapsed is not None else "  failed"))
+
+    print("\nSeparate processes (one per app)")
+    total_rss = 0.0
+    for script in APP_SCRIPTS:
+        result = run_child(script, [])
+        total_rss += result['peak_rss_mb']
+        print(f"  {script:<16} first render {result['first_render_ms']:8.1f} ms  peak RSS {result['peak_rss_mb']:7.1f} MB")
+    print(f"  {'total':<16} {'':>30}  peak RSS {total_rss:7.1f} MB")
+
+    print("\nSingle launcher process (streamlit_app.py)")
+    from streamlit_app import APPS
+    result = run_child("streamlit_app.py", [app[4] for app in APPS])
+    print(f"  {'home':<16} first render {result['first_render_ms']:8.1f} ms")
+    for page, elapsed in result['page_render_ms'].items():
+        print(f"  {page:<16} first visit  {elapsed:8.1f} ms")
+    print(f"  {'total':<16} {'':>30}  peak RSS {result['peak_rss_mb']:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from task_store import ORDERS, STATUS_FILTERS, TaskStore
+
+# Render and mutation latency of the task store / To-Do page at scale
+
+
+def timed(func, repeat):
+    """
+    Median latency of func in milliseconds
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def populate(store, n_tasks, seed=0):
+    rng = random.Random(seed)
+    store.bulk_add(
+        {
+            'text': f"Task {i}",
+            'done': rng.random() < 0.5,
+            'due_date': None if rng.random() < 0.3 else f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        }
+        for i in range(n_tasks)
+    )
+
+
+def bench_store(store, n_tasks, repeat, seed=0):
+    # Disjoint random ids, so delete never hits a row complete just touched
+    ids = random.Random(seed).sample(range(1, n_tasks + 1), 2 * repeat)
+    complete_ids, delete_ids = iter(ids[:repeat]), iter(ids[repeat:])
+    results = {
+        'add': timed(lambda: store.add("Benchmark task", "2026-06-01"), repeat),
+        'complete': timed(lambda: store.set_done(next(complete_ids)), repeat),
+        'delete': timed(lambda: store.delete(next(delete_ids)), repeat),
+        'count': timed(lambda: store.count('open'), repeat)
+    }
+    last_page = max(0, n_tasks // 20 - 1)
+    for status in STATUS_FILTERS:
+        for order in ORDERS:
+            results[f'page {status}/{order}'] = timed(lambda: store.page(0, 20, status, order), repeat)
+    results['page all/due (last)'] = timed(lambda: store.page(last_page, 20, 'all', 'due'), repeat)
+    return results
+
+
+def bench_render(db_path, repeat):
+    # Imported lazily so the store benchmark runs without Streamlit
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["TODO_DB"] = db_path
+    app = AppTest.from_file("TO-DO-LIST.py", default_timeout=30)
+    app.run()
+    return timed(app.run, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="To-Do task store benchmark")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--no-render", action="store_true", help="Skip the Streamlit render benchmark")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if min(args.tasks) < 2 * args.repeat:
+        parser.error(f"--tasks must each be at least 2 * --repeat ({2 * args.repeat}) "
+                     "so complete and delete get distinct ids")
+
+    for n_tasks in args.tasks:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "tasks.db")
+            store = TaskStore(db_path)
+            start = time.perf_counter()
+            populate(store, n_tasks)
+            print(f"\n{n_tasks} tasks (bulk import {time.perf_counter() - start:.2f}s)")
+
+            for name, latency in bench_store(store, n_tasks, args.repeat).items():
+                print(f"  {name:<24} {latency:8.3f} ms")
+            store.close()
+
+            if not args.no_render:
+                print(f"  {'page render':<24} {bench_render(db_path, max(1, args.repeat // 10)):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,49 @@
 import streamlit as st
-import random
-import time
 
-# Function to generate a random crash point
+from crash_round import CrashRound
+from crash_sim import generate_crash_points
+
+# Seconds between flight display refreshes
+REFRESH_INTERVAL = 0.2
+
+# Function to generate a random crash point (same engine as the simulator)
 def generate_crash_point():
-    return round(random.uniform(1.5, 25.0), 2)  # Random crash point between 1.5 and 5.0
+    return float(generate_crash_points(1)[0])  # Random crash point between 1.5 and 25.0
+
+# Flight display; only this fragment reruns on each tick, not the whole script
+@st.fragment(run_every=REFRESH_INTERVAL)
+def flight_display():
+    game = st.session_state.round
+    if not game.running():
+        # Round ended between ticks; rerun the page to show the result and buttons
+        st.rerun()
+
+    st.write("The jet is flying... 🚀")
+    offset = min(int(game.elapsed() / REFRESH_INTERVAL), 100) * 2
+    st.markdown(f"<div style='font-size:30px; margin-left:{offset}px;'>✈️</div>", unsafe_allow_html=True)
+    st.write(f"Multiplier: **x{game.multiplier()}**")
+
+# Final state of a finished round
+def round_result(game):
+    if game.cashed_out_at is not None:
+        winnings = round(st.session_state.bet * game.cashed_out_at, 2)
+        st.success(f"🎉 You cashed out at x{game.cashed_out_at}! You won ${winnings}.")
+    else:
+        st.markdown("<div style='font-size:30px;'>💥</div>", unsafe_allow_html=True)
+        st.error(f"💥 Crash! The jet exploded at x{game.crash_point}. You lost your bet.")
+
+# Button callbacks run before the script, so the page renders the new state directly
+def start_round():
+    st.session_state.round = CrashRound(generate_crash_point())
+    st.session_state.bet = st.session_state.bet_input
+
+def cash_out():
+    # The multiplier is taken when the click reaches the server
+    if st.session_state.round is not None:
+        st.session_state.round.cash_out()
+
+def reset_round():
+    st.session_state.round = None
 
 # Function to simulate the Crash Game
 def crash_game():
@@ -12,64 +51,26 @@ def crash_game():
     st.write("Place your bet and cash out before the jet explodes!")
 
     # Initialize game state
-    if "multiplier" not in st.session_state:
-        st.session_state.multiplier = 1.0
-        st.session_state.crash_point = generate_crash_point()
-        st.session_state.running = False
-        st.session_state.cash_out = False
+    if "round" not in st.session_state:
+        st.session_state.round = None
+        st.session_state.bet = 0.0
 
     # Input for placing a bet
-    bet = st.number_input("Place your bet ($)", min_value=1.0, step=0.5, value=10.0)
-
-    # Button to start the game
-    if st.button("Start"):
-        st.session_state.multiplier = 1.0
-        st.session_state.crash_point = generate_crash_point()
-        st.session_state.running = True
-        st.session_state.cash_out = False
-
-        # Placeholder for jet and multiplier
-        jet_placeholder = st.empty()
-        multiplier_placeholder = st.empty()
-
-        # Simulate the jet flying and multiplier increasing
-        st.write("The jet is flying... 🚀")
-        for i in range(100):
-            if not st.session_state.running:
-                break
-
-            # Update multiplier
-            st.session_state.multiplier = round(st.session_state.multiplier + 0.1, 2)
-            
-            # Update jet position
-            jet_placeholder.markdown(f"<div style='font-size:30px; margin-left:{i*2}px;'>✈️</div>", unsafe_allow_html=True)
-            multiplier_placeholder.write(f"Multiplier: **x{st.session_state.multiplier}**")
-            time.sleep(0.2)
-
-            # Check for crash
-            if st.session_state.multiplier >= st.session_state.crash_point:
-                st.session_state.running = False
-                if not st.session_state.cash_out:
-                    jet_placeholder.markdown("<div style='font-size:30px;'>💥</div>", unsafe_allow_html=True)
-                    st.error(f"💥 Crash! The jet exploded at x{st.session_state.crash_point}. You lost your bet.")
-                break
+    st.number_input("Place your bet ($)", min_value=1.0, step=0.5, value=10.0, key="bet_input")
 
-    # Cash Out Button
-    if st.session_state.running and not st.session_state.cash_out:
-        if st.button("Cash Out"):
-            st.session_state.cash_out = True
-            st.session_state.running = False
-            winnings = round(bet * st.session_state.multiplier, 2)
-            st.success(f"🎉 You cashed out at x{st.session_state.multiplier}! You won ${winnings}.")
+    game = st.session_state.round
+    if game is None:
+        # Button to start the game
+        st.button("Start", on_click=start_round)
+    elif game.running():
+        # Cash Out Button
+        st.button("Cash Out", on_click=cash_out)
+        flight_display()
+    else:
+        round_result(game)
 
-    # Reset Button
-    if not st.session_state.running:
-        if st.button("Play Again"):
-            st.session_state.multiplier = 1.0
-            st.session_state.crash_point = generate_crash_point()
-            st.session_state.running = False
-            st.session_state.cash_out = False
-            st.experimental_rerun()
+        # Reset Button
+        st.button("Play Again", on_click=reset_round)
 
 # Run the Crash Game
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+import time
+
+# Multiplier growth per second (matches the old +0.1 every 0.2s loop)
+GROWTH_RATE = 0.5
+
+
+class CrashRound:
+    def __init__(self, crash_point, start_time=None, clock=time.monotonic):
+        """
+        A single crash round whose state is derived from its start timestamp.
+        Nothing runs between updates, so a round costs no thread while in flight.
+        :param crash_point: Multiplier at which the jet explodes
+        :param start_time: Clock reading when the round started (defaults to now)
+        :param clock: Zero-argument time source, in seconds
+        """
+        self.crash_point = crash_point
+        self.clock = clock
+        self.start_time = clock() if start_time is None else start_time
+        self.cashed_out_at = None
+
+    @property
+    def crash_time(self):
+        """
+        Seconds after the start at which the jet explodes
+        """
+        return (self.crash_point - 1.0) / GROWTH_RATE
+
+    def elapsed(self, now=None):
+        now = self.clock() if now is None else now
+        return max(0.0, now - self.start_time)
+
+    def multiplier(self, now=None):
+        """
+        Current multiplier, capped at the crash point
+        :param now: Clock reading to evaluate at (defaults to now)
+        :return: Multiplier rounded to 2 decimals
+        """
+        value = 1.0 + GROWTH_RATE * self.elapsed(now)
+        if value >= self.crash_point:
+            return self.crash_point
+        # Never round a surviving multiplier up onto the crash point
+        return min(round(value, 2), round(self.crash_point - 0.01, 2))
+
+    def crashed(self, now=None):
+        return self.cashed_out_at is None and self.elapsed(now) >= self.crash_time
+
+    def running(self, now=None):
+        return self.cashed_out_at is None and not self.crashed(now)
+
+    def cash_out(self, now=None):
+        """
+        Cash out at the multiplier reached at the given moment
+        :param now: Clock reading of the click (defaults to now)
+        :return: Multiplier locked in, or None if the jet already exploded
+        """
+        if self.cashed_out_at is not None:
+            return self.cashed_out_at
+        if self.crashed(now):
+            return None
+        self.cashed_out_at = self.multiplier(now)
+        return self.cashed_out_at
@@ -0,0 +1,219 @@
+import argparse
+import json
+import numbers
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Crash point range used by the Streamlit game
+CRASH_LOW = 1.5
+CRASH_HIGH = 25.0
+
+# Rounds generated per block; keeps memory flat for multi-million round runs
+CHUNK_SIZE = 1_000_000
+
+_default_rng = np.random.default_rng()
+
+
+def generate_crash_points(n, rng=None, low=CRASH_LOW, high=CRASH_HIGH):
+    """
+    Draw crash points for n rounds
+    :param n: Number of rounds
+    :param rng: numpy Generator (a shared unseeded one is used if omitted)
+    :return: Array of crash points rounded to 2 decimals
+    """
+    rng = _default_rng if rng is None else rng
+    return np.round(rng.uniform(low, high, size=n), 2)
+
+
+def round_payouts(crash_points, target):
+    """
+    Payout multiplier per round for a fixed cash-out target.
+    The jet explodes as soon as the multiplier reaches the crash point,
+    so cashing out only succeeds when the target is strictly below it.
+    :param crash_points: Array of crash points
+    :param target: Cash-out multiplier (scalar or broadcastable array)
+    :return: Array of payouts (target on success, 0 on crash)
+    """
+    return np.where(crash_points > target, target, 0.0)
+
+
+def _check_count(name, value):
+    # Counts feed range/array sizes, so floats and bools are rejected too
+    if isinstance(value, bool) or not isinstance(value, numbers.Integral) or value < 1:
+        raise ValueError(f"{name} must be a positive integer, got {value!r}")
+
+
+def _seed_sequences(seed, n_chunks):
+    # One child sequence per chunk so results don't depend on worker count
+    return np.random.SeedSequence(seed).spawn(n_chunks)
+
+
+def _chunk_sizes(total, chunk_size):
+    full, rest = divmod(total, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def _run_jobs(func, jobs, workers):
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, jobs))
+    return [func(job) for job in jobs]
+
+
+def _payout_moments(job):
+    seed_seq, n, targets = job
+    crash_points = generate_crash_points(n, np.random.default_rng(seed_seq))
+    payouts = round_payouts(crash_points[:, None], np.asarray(targets)[None, :])
+    return (
+        (payouts > 0).sum(axis=0),
+        payouts.sum(axis=0),
+        np.square(payouts).sum(axis=0)
+    )
+
+
+def simulate_rtp(n_rounds, targets, seed=None, workers=1, chunk_size=CHUNK_SIZE):
+    """
+    Estimate return-to-player and variance for several cash-out targets.
+    All targets are evaluated against the same simulated rounds.
+    :param n_rounds: Number of simulated rounds
+    :param targets: Iterable of cash-out multipliers
+    :param seed: Seed for reproducible runs
+    :param workers: Number of processes (1 runs in-process)
+    :param chunk_size: Rounds generated per block
+    :return: List of dictionaries, one per target
+    """
+    _check_count("n_rounds", n_rounds)
+    _check_count("chunk_size", chunk_size)
+    targets = [float(t) for t in targets]
+    if not targets:
+        raise ValueError("targets must not be empty")
+    sizes = _chunk_sizes(n_rounds, chunk_size)
+    jobs = [(s, n, targets) for s, n in zip(_seed_sequences(seed, len(sizes)), sizes)]
+    results = _run_jobs(_payout_moments, jobs, workers)
+
+    wins = sum(r[0] for r in results)
+    mean = sum(r[1] for r in results) / n_rounds
+    variance = sum(r[2] for r in results) / n_rounds - np.square(mean)
+
+    return [
+        {
+            'target': target,
+            'win_rate': float(wins[i] / n_rounds),
+            'rtp': float(mean[i]),
+            'house_edge': float(1 - mean[i]),
+            'variance': float(variance[i])
+        }
+        for i, target in enumerate(targets)
+    ]
+
+
+def _bankroll_paths(job):
+    seed_seq, n_sessions, n_rounds, target, bankroll, bet, bet_fraction, min_bet = job
+    rng = np.random.default_rng(seed_seq)
+    crash_points = generate_crash_points(n_sessions * n_rounds, rng).reshape(n_sessions, n_rounds)
+    net = round_payouts(crash_points, target) - 1.0
+
+    if bet_fraction is None:
+        # Flat stake: ruined once the bankroll can no longer cover it
+        paths = bankroll + np.cumsum(bet * net, axis=1)
+        ruined_mask = paths < bet
+    else:
+        # Proportional stake: ruined once the stake drops below the table minimum
+        paths = bankroll * np.cumprod(1.0 + bet_fraction * net, axis=1)
+        ruined_mask = paths * bet_fraction < min_bet
+
+    ruined = ruined_mask.any(axis=1)
+    # Freeze ruined sessions at the round they went bust
+    stop = np.where(ruined, ruined_mask.argmax(axis=1), n_rounds - 1)
+    final = paths[np.arange(n_sessions), stop]
+    return int(ruined.sum()), final.sum(), np.square(final).sum()
+
+
+def simulate_bankroll(n_sessions, n_rounds, target, bankroll=100.0, bet=10.0,
+                      bet_fraction=None, min_bet=1.0, seed=None, workers=1,
+                      chunk_size=CHUNK_SIZE):
+    """
+    Simulate betting sessions with a fixed cash-out target
+    :param n_sessions: Number of independent sessions
+    :param n_rounds: Rounds played per session
+    :param target: Cash-out multiplier
+    :param bankroll: Starting bankroll per session
+    :param bet: Flat stake (ignored when bet_fraction is set)
+    :param bet_fraction: Stake as a fraction of the current bankroll
+    :param min_bet: Smallest stake the table accepts
+    :param seed: Seed for reproducible runs
+    :param workers: Number of processes (1 runs in-process)
+    :param chunk_size: Approximate rounds generated per block
+    :return: Dictionary with ruin probability and final bankroll statistics
+    """
+    _check_count("n_sessions", n_sessions)
+    _check_count("n_rounds", n_rounds)
+    _check_count("chunk_size", chunk_size)
+    if bet_fraction is not None and not 0 < bet_fraction <= 1:
+        raise ValueError("bet_fraction must be in (0, 1]")
+
+    # Same ruin rules as _bankroll_paths, applied before the first round
+    if bet_fraction is None:
+        ruined_at_start = bankroll < bet
+    else:
+        ruined_at_start = bankroll * bet_fraction < min_bet
+    if ruined_at_start:
+        return {
+            'target': float(target),
+            'ruin_probability': 1.0,
+            'mean_final_bankroll': float(bankroll),
+            'final_bankroll_variance': 0.0
+        }
+
+    sessions_per_chunk = max(1, chunk_size // n_rounds)
+    sizes = _chunk_sizes(n_sessions, sessions_per_chunk)
+    jobs = [
+        (s, n, n_rounds, float(target), bankroll, bet, bet_fraction, min_bet)
+        for s, n in zip(_seed_sequences(seed, len(sizes)), sizes)
+    ]
+    results = _run_jobs(_bankroll_paths, jobs, workers)
+
+    ruined = sum(r[0] for r in results)
+    mean = sum(r[1] for r in results) / n_sessions
+    variance = sum(r[2] for r in results) / n_sessions - mean ** 2
+
+    return {
+        'target': float(target),
+        'ruin_probability': ruined / n_sessions,
+        'mean_final_bankroll': float(mean),
+        'final_bankroll_variance': float(variance)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crash game Monte Carlo simulator")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="Rounds for RTP estimation")
+    parser.add_argument("--targets", type=float, nargs="+", default=[1.5, 2.0, 5.0, 10.0, 20.0])
+    parser.add_argument("--sessions", type=int, default=10_000, help="Sessions for ruin estimation")
+    parser.add_argument("--session-rounds", type=int, default=100)
+    parser.add_argument("--bankroll", type=float, default=100.0)
+    parser.add_argument("--bet", type=float, default=10.0)
+    parser.add_argument("--bet-fraction", type=float, default=None)
+    parser.add_argument("--min-bet", type=float, default=1.0, help="Table minimum for proportional stakes")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    report = {
+        'rtp': simulate_rtp(args.rounds, args.targets, seed=args.seed, workers=args.workers),
+        'bankroll': [
+            simulate_bankroll(
+                args.sessions, args.session_rounds, target,
+                bankroll=args.bankroll, bet=args.bet, bet_fraction=args.bet_fraction,
+                min_bet=args.min_bet, seed=args.seed, workers=args.workers
+            )
+            for target in args.targets
+        ]
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
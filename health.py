@@ -1,8 +1,6 @@
-import psutil
 import platform
 import socket
 import uuid
-import GPUtil
 import time
 import threading
 import json
@@ -11,9 +9,9 @@ from datetime import datetime
 import logging
 import sqlite3
 import queue
-import smtplib
-from email.mime.text import MIMEText
-import speedtest
+
+# psutil, speedtest and smtplib are imported inside the collectors that use them,
+# so loading this module stays cheap when those collectors never run
 
 class DeviceHealthMonitor:
     def __init__(self, config_path='config.json'):
@@ -130,6 +128,7 @@ class DeviceHealthMonitor:
         :return: Dictionary of CPU metrics
         """
         try:
+            import psutil
             cpu_usage = psutil.cpu_percent(interval=1)
             cpu_temp = self.get_cpu_temperature()
             return {
@@ -145,6 +144,7 @@ class DeviceHealthMonitor:
         Monitor memory usage
         :return: Memory usage percentage
         """
+        import psutil
         memory = psutil.virtual_memory()
         return memory.percent
 
@@ -153,6 +153,7 @@ class DeviceHealthMonitor:
         Monitor disk usage
         :return: Disk usage percentage
         """
+        import psutil
         disk = psutil.disk_usage('/')
         return disk.percent
 
@@ -162,6 +163,7 @@ class DeviceHealthMonitor:
         :return: Network performance metrics
         """
         try:
+            import speedtest
             st = speedtest.Speedtest()
             download_speed = st.download() / 1_000_000  # Convert to Mbps
             upload_speed = st.upload() / 1_000_000  # Convert to Mbps
@@ -256,6 +258,8 @@ class DeviceHealthMonitor:
         :param message: Notification message
         """
         try:
+            import smtplib
+            from email.mime.text import MIMEText
             smtp_config = self.config['smtp_config']
             msg = MIMEText(message)
             msg['Subject'] = "Device Health Alert"
@@ -0,0 +1,42 @@
+import importlib
+
+import streamlit as st
+
+# Single entry point hosting every app in one server process:
+#   streamlit run streamlit_app.py
+# Each page imports its module on first visit, so pandas/numpy and friends are
+# only loaded once a page that needs them is opened. Imported modules (and their
+# st.cache_resource / st.cache_data caches) are shared by all sessions.
+
+def lazy_page(module_name, entry_point):
+    def page():
+        module = importlib.import_module(module_name)
+        getattr(module, entry_point)()
+    return page
+
+# (module, entry point, title, icon, url path)
+APPS = [
+    ("app", "main", "Excel Search", "📊", "excel-search"),
+    ("calculator", "calculator", "Calculator", "🧮", "calculator"),
+    ("crash_game", "crash_game", "Crash Game", "✈️", "crash-game"),
+    ("TO-DO-LIST", "todo_list", "To-Do List", "📝", "todo-list"),
+]
+
+# Landing page; imports nothing beyond streamlit so the first render stays fast
+def home(pages):
+    st.title("30 sec projects")
+    st.write("Pick an app:")
+    for page in pages:
+        st.page_link(page)
+
+def main():
+    st.set_page_config(page_title="30 sec projects")
+    pages = [
+        st.Page(lazy_page(module_name, entry_point), title=title, icon=icon, url_path=url_path)
+        for module_name, entry_point, title, icon, url_path in APPS
+    ]
+    home_page = st.Page(lambda: home(pages), title="Home", icon="🏠", url_path="home", default=True)
+    st.navigation([home_page] + pages).run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import csv
+import io
+import json
+import sqlite3
+import threading
+from datetime import date, datetime
+
+# Status filters accepted by count() and page()
+STATUS_FILTERS = {
+    'all': '',
+    'open': 'WHERE done = 0',
+    'done': 'WHERE done = 1'
+}
+
+# Sort orders accepted by page(); each one is served by an index
+ORDERS = {
+    'newest': 'ORDER BY id DESC',
+    'oldest': 'ORDER BY id',
+    'due': 'ORDER BY due_date IS NULL, due_date, id'
+}
+
+EXPORT_FIELDS = ['id', 'text', 'done', 'due_date', 'created_at']
+
+# Accepted spellings of a completed task in imported files
+TRUE_STRINGS = ('1', 'true', 'yes')
+
+
+def parse_done(value):
+    """
+    Normalise an imported 'done' value; strings like "false" are not completed
+    """
+    if isinstance(value, str):
+        return int(value.strip().lower() in TRUE_STRINGS)
+    return int(bool(value))
+
+
+def parse_due_date(value):
+    """
+    Validate a due date
+    :param value: ISO date string, date, or empty
+    :return: ISO date string or None
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    try:
+        return date.fromisoformat(str(value).strip()).isoformat()
+    except ValueError:
+        raise ValueError(f"Invalid due date: {value!r} (expected YYYY-MM-DD)") from None
+
+
+class TaskStore:
+    def __init__(self, db_path='tasks.db'):
+        """
+        SQLite-backed task list with stable ids
+        :param db_path: Path to the SQLite database (':memory:' for a throwaway store)
+        """
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        # Streamlit sessions share one store from different threads
+        self.lock = threading.Lock()
+        self.setup_database()
+
+    def setup_database(self):
+        """
+        Create the tasks table and its indexes
+        """
+        with self.lock, self.conn:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    done INTEGER NOT NULL DEFAULT 0,
+                    due_date TEXT,
+                    created_at TEXT NOT NULL
+                )
+            ''')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_tasks_done_id ON tasks (done, id)')
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks (due_date IS NULL, due_date, id)'
+            )
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_tasks_done_due ON tasks (done, due_date IS NULL, due_date, id)'
+            )
+
+    def add(self, text, due_date=None):
+        """
+        Add a task
+        :param text: Task description
+        :param due_date: Optional ISO date string (ValueError if malformed)
+        :return: Id of the new task
+        """
+        due_date = parse_due_date(due_date)
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO tasks (text, due_date, created_at) VALUES (?, ?, ?)',
+                (text, due_date, datetime.now().isoformat(timespec='seconds'))
+            )
+            return cursor.lastrowid
+
+    def set_done(self, task_id, done=True):
+        """
+        Mark a task as completed (or open again)
+        :return: True if the task exists
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute('UPDATE tasks SET done = ? WHERE id = ?', (int(done), task_id))
+            return cursor.rowcount == 1
+
+    def delete(self, task_id):
+        """
+        Delete a task by id
+        :return: True if the task existed
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
+            return cursor.rowcount == 1
+
+    def get(self, task_id):
+        with self.lock:
+            row = self.conn.execute('SELECT * FROM tasks WHERE id = ?', (task_id,)).fetchone()
+        return dict(row) if row else None
+
+    def count(self, status='all'):
+        with self.lock:
+            return self.conn.execute(f'SELECT COUNT(*) FROM tasks {STATUS_FILTERS[status]}').fetchone()[0]
+
+    def page(self, page=0, page_size=20, status='all', order='newest'):
+        """
+        Fetch one page of tasks
+        :param page: Zero-based page number
+        :param page_size: Tasks per page
+        :param status: One of STATUS_FILTERS
+        :param order: One of ORDERS
+        :return: List of task dictionaries
+        """
+        query = f'SELECT * FROM tasks {STATUS_FILTERS[status]} {ORDERS[order]} LIMIT ? OFFSET ?'
+        with self.lock:
+            rows = self.conn.execute(query, (page_size, page * page_size)).fetchall()
+        return [dict(row) for row in rows]
+
+    def bulk_add(self, tasks):
+        """
+        Insert many tasks in one transaction
+        :param tasks: Iterable of dictionaries with 'text' and optional 'done'/'due_date'
+        :return: Number of tasks inserted (nothing is inserted if any task is invalid)
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = []
+        for task in tasks:
+            if not isinstance(task, dict):
+                raise ValueError(f"Each task must be an object, got {type(task).__name__}")
+            text = str(task.get('text') or '').strip()
+            if not text:
+                continue
+            rows.append((
+                text,
+                parse_done(task.get('done', 0)),
+                parse_due_date(task.get('due_date')),
+                task.get('created_at') or now
+            ))
+        with self.lock, self.conn:
+            self.conn.executemany(
+                'INSERT INTO tasks (text, done, due_date, created_at) VALUES (?, ?, ?, ?)', rows
+            )
+        return len(rows)
+
+    def export(self):
+        """
+        All tasks in id order
+        :return: List of task dictionaries
+        """
+        with self.lock:
+            rows = self.conn.execute('SELECT * FROM tasks ORDER BY id').fetchall()
+        return [dict(row) for row in rows]
+
+    def import_file(self, data, file_format):
+        """
+        Bulk import tasks from JSON or CSV; ids are reassigned on import
+        :param data: File contents as text
+        :param file_format: 'json' or 'csv'
+        :return: Number of tasks inserted
+        """
+        if file_format == 'json':
+            tasks = json.loads(data)
+            if not isinstance(tasks, list):
+                raise ValueError("JSON import must be a list of task objects")
+        elif file_format == 'csv':
+            # Spreadsheet exports often carry a BOM and capitalised headers
+            reader = csv.DictReader(io.StringIO(data.lstrip('\ufeff')))
+            if reader.fieldnames is None:
+                raise ValueError("CSV import is empty")
+            reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+            if 'text' not in reader.fieldnames:
+                raise ValueError("CSV import needs a 'text' column")
+            tasks = list(reader)
+        else:
+            raise ValueError(f"Unsupported format: {file_format}")
+        return self.bulk_add(tasks)
+
+    def export_file(self, file_format):
+        """
+        Serialize all tasks to JSON or CSV
+        :param file_format: 'json' or 'csv'
+        :return: File contents as text
+        """
+        tasks = self.export()
+        if file_format == 'json':
+            return json.dumps(tasks, indent=2)
+        if file_format == 'csv':
+            output = io.StringIO()
+            writer = csv.DictWriter(output, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(tasks)
+            return output.getvalue()
+        raise ValueError(f"Unsupported format: {file_format}")
+
+    def close(self):
+        self.conn.close()
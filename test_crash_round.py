@@ -0,0 +1,35 @@
+import unittest
+
+from crash_round import GROWTH_RATE, CrashRound
+
+class TestCrashRound(unittest.TestCase):
+    def setUp(self):
+        self.game = CrashRound(3.0, start_time=100.0, clock=lambda: 100.0)
+
+    def test_multiplier_follows_elapsed_time(self):
+        self.assertEqual(self.game.multiplier(now=100.0), 1.0)
+        self.assertEqual(self.game.multiplier(now=102.0), round(1.0 + 2 * GROWTH_RATE, 2))
+
+    def test_crash_time(self):
+        crash_at = 100.0 + self.game.crash_time
+        self.assertTrue(self.game.running(now=crash_at - 0.001))
+        self.assertTrue(self.game.crashed(now=crash_at))
+        self.assertEqual(self.game.multiplier(now=crash_at + 10), 3.0)
+
+    def test_multiplier_never_rounds_onto_crash_point(self):
+        almost = 100.0 + self.game.crash_time - 0.001
+        self.assertLess(self.game.multiplier(now=almost), self.game.crash_point)
+
+    def test_cash_out_uses_click_time(self):
+        self.assertEqual(self.game.cash_out(now=101.0), 1.5)
+        self.assertFalse(self.game.running(now=200.0))
+        self.assertFalse(self.game.crashed(now=200.0))
+        # A second click keeps the first result
+        self.assertEqual(self.game.cash_out(now=103.0), 1.5)
+
+    def test_cash_out_after_crash(self):
+        self.assertIsNone(self.game.cash_out(now=200.0))
+        self.assertIsNone(self.game.cashed_out_at)
+
+if __name__ == "__main__":
+    unittest.main()
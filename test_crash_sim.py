@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+
+from crash_sim import (
+    CRASH_HIGH,
+    CRASH_LOW,
+    generate_crash_points,
+    round_payouts,
+    simulate_bankroll,
+    simulate_rtp,
+)
+
+class TestCrashSimulator(unittest.TestCase):
+    def test_crash_points_in_range(self):
+        points = generate_crash_points(10_000, np.random.default_rng(0))
+        self.assertEqual(len(points), 10_000)
+        self.assertGreaterEqual(points.min(), CRASH_LOW)
+        self.assertLessEqual(points.max(), CRASH_HIGH)
+
+    def test_round_payouts(self):
+        # Reaching the crash point exactly counts as a crash
+        payouts = round_payouts(np.array([1.5, 2.0, 3.0]), 2.0)
+        np.testing.assert_array_equal(payouts, [0.0, 0.0, 2.0])
+
+    def test_rtp_matches_uniform_distribution(self):
+        target = 10.0
+        result = simulate_rtp(200_000, [target], seed=1)[0]
+        expected = target * (CRASH_HIGH - target) / (CRASH_HIGH - CRASH_LOW)
+        self.assertAlmostEqual(result['rtp'], expected, delta=0.05)
+        self.assertAlmostEqual(result['house_edge'], 1 - result['rtp'])
+
+    def test_results_reproducible_across_workers(self):
+        serial = simulate_rtp(50_000, [2.0, 5.0], seed=7, chunk_size=10_000)
+        parallel = simulate_rtp(50_000, [2.0, 5.0], seed=7, workers=2, chunk_size=10_000)
+        self.assertEqual(serial, parallel)
+
+    def test_flat_bet_cannot_be_ruined_below_crash_range(self):
+        # Every round crashes above 1.5, so a 1.2x target always wins
+        result = simulate_bankroll(100, 50, 1.2, bankroll=10.0, bet=10.0, seed=3)
+        self.assertEqual(result['ruin_probability'], 0.0)
+        self.assertAlmostEqual(result['mean_final_bankroll'], 10.0 + 50 * 2.0)
+
+    def test_high_target_ruins_small_bankroll(self):
+        result = simulate_bankroll(1_000, 100, 24.0, bankroll=10.0, bet=10.0, seed=3)
+        self.assertGreater(result['ruin_probability'], 0.9)
+
+    def test_bankroll_below_first_stake_is_ruined(self):
+        flat = simulate_bankroll(10, 10, 1.2, bankroll=5.0, bet=10.0, seed=3)
+        self.assertEqual(flat['ruin_probability'], 1.0)
+        self.assertEqual(flat['mean_final_bankroll'], 5.0)
+
+        proportional = simulate_bankroll(10, 10, 1.2, bankroll=5.0, bet_fraction=0.1, min_bet=1.0, seed=3)
+        self.assertEqual(proportional['ruin_probability'], 1.0)
+
+    def test_non_positive_counts(self):
+        with self.assertRaises(ValueError):
+            simulate_rtp(0, [2.0])
+        with self.assertRaises(ValueError):
+            simulate_bankroll(10, 0, 2.0)
+        with self.assertRaises(ValueError):
+            simulate_bankroll(0, 10, 2.0)
+        # Whole-valued or not, floats aren't counts
+        with self.assertRaises(ValueError):
+            simulate_rtp(10.5, [2.0])
+        with self.assertRaises(ValueError):
+            simulate_bankroll(10, 10.0, 2.0)
+        with self.assertRaises(ValueError):
+            simulate_rtp(100, [2.0], chunk_size=2.5)
+        # numpy integers are accepted
+        self.assertEqual(len(simulate_rtp(np.int64(100), [2.0], seed=1)), 1)
+
+    def test_invalid_bet_fraction(self):
+        with self.assertRaises(ValueError):
+            simulate_bankroll(10, 10, 2.0, bet_fraction=1.5)
+
+if __name__ == "__main__":
+    unittest.main()
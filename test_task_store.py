@@ -0,0 +1,95 @@
+import unittest
+
+from task_store import TaskStore
+
+class TestTaskStore(unittest.TestCase):
+    def setUp(self):
+        self.store = TaskStore(":memory:")
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_duplicate_texts_get_distinct_ids(self):
+        first = self.store.add("Buy milk")
+        second = self.store.add("Buy milk")
+        self.assertNotEqual(first, second)
+
+        self.assertTrue(self.store.delete(first))
+        remaining = self.store.page()
+        self.assertEqual([task["id"] for task in remaining], [second])
+
+    def test_complete_and_filter(self):
+        task_id = self.store.add("Write report")
+        self.store.add("Call Bob")
+        self.assertTrue(self.store.set_done(task_id))
+
+        self.assertEqual(self.store.count("done"), 1)
+        self.assertEqual(self.store.count("open"), 1)
+        self.assertEqual(self.store.page(status="done")[0]["text"], "Write report")
+        self.assertFalse(self.store.set_done(999))
+
+    def test_pagination_and_due_order(self):
+        self.store.bulk_add([{"text": f"Task {i}"} for i in range(45)])
+        self.store.add("Later", "2030-01-01")
+        self.store.add("Sooner", "2029-01-01")
+
+        self.assertEqual(len(self.store.page(0, 20)), 20)
+        self.assertEqual(len(self.store.page(2, 20)), 7)
+        # Dated tasks first, undated tasks last
+        by_due = self.store.page(0, 3, order="due")
+        self.assertEqual([task["text"] for task in by_due], ["Sooner", "Later", "Task 0"])
+
+    def test_export_import_round_trip(self):
+        self.store.add("Buy milk", "2026-01-01")
+        done_id = self.store.add("Call Bob")
+        self.store.set_done(done_id)
+
+        for file_format in ("json", "csv"):
+            other = TaskStore(":memory:")
+            self.assertEqual(other.import_file(self.store.export_file(file_format), file_format), 2)
+            exported = [(t["text"], t["done"], t["due_date"]) for t in other.export()]
+            self.assertEqual(exported, [("Buy milk", 0, "2026-01-01"), ("Call Bob", 1, None)])
+            other.close()
+
+    def test_malformed_json_import(self):
+        for data in ('{"text": "a"}', '[1, 2]', '"x"', '[{"text": "a"}, 3]'):
+            with self.assertRaises(ValueError):
+                self.store.import_file(data, "json")
+        # Nothing from a rejected file is stored
+        self.assertEqual(self.store.count(), 0)
+
+    def test_done_strings_agree_between_formats(self):
+        self.store.import_file('[{"text": "a", "done": "false"}, {"text": "b", "done": "True"}]', "json")
+        self.store.import_file("text,done\nc,false\nd,True\n", "csv")
+        self.assertEqual([task["done"] for task in self.store.export()], [0, 1, 0, 1])
+
+    def test_csv_header_variants(self):
+        # Excel writes a BOM before the header
+        self.assertEqual(self.store.import_file("\ufefftext,done\na,1\n", "csv"), 1)
+        self.assertEqual(self.store.import_file("Text,Done\nb,0\n", "csv"), 1)
+        self.assertEqual([task["text"] for task in self.store.export()], ["a", "b"])
+
+    def test_csv_without_text_column(self):
+        for data in ("task,done\na,1\n", ""):
+            with self.assertRaises(ValueError):
+                self.store.import_file(data, "csv")
+
+    def test_blank_texts_are_skipped(self):
+        added = self.store.import_file("text,done,due_date\n  ,1,\n  padded  ,0,\n", "csv")
+        self.assertEqual(added, 1)
+        self.assertEqual(self.store.export()[0]["text"], "padded")
+
+    def test_invalid_due_date(self):
+        with self.assertRaises(ValueError):
+            self.store.import_file('[{"text": "a", "due_date": "tomorrow"}]', "json")
+        with self.assertRaises(ValueError):
+            self.store.add("a", "2026-13-01")
+        self.store.add("b", " 2026-02-03 ")
+        self.assertEqual(self.store.export()[0]["due_date"], "2026-02-03")
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            self.store.export_file("xml")
+
+if __name__ == "__main__":
+    unittest.main()